@@ -1,108 +1,624 @@
 #!/usr/bin/env python3
 """
-Mock instrumented JS engine.
+Mock instrumented JS engine for testing coverage-guided fuzzing.
 
-- Accepts a JS file as input (last arg or --js path).
+- Accepts a JS file as input (trailing arg or --js path).
 - Prints `edges:<N>` to stdout.
 - Optionally writes the same to /tmp/kre8_edges.txt (or --edges-file path).
-- Exits with 0 for success, non-zero to simulate "crashes".
+- Exits with 0 for success, 1 to simulate "crashes" (inputs containing
+  `CRASH` or `throw`, or with probability --crash-rate).
+
+`tools/mock_engine.py` is a shim that runs this module.
 
 Environment variables (or flags) to control behavior:
 - MOCK_EDGES_MODE=rand|inc      (default: rand)
 - MOCK_EDGES_MIN=100            (default: 100)
-- MOCK_EDGES_MAX=5000           (default: 5000)
+- MOCK_EDGES_MAX=10000          (default: 10000)
 - MOCK_CRASH_RATE=0.05          (default: 0.0)  # probability of simulating a crash
-- MOCK_SEED=...                 (default: None) # for reproducibility
+- MOCK_CRASH_SCAN_BYTES=N       (default: 65536, 0 = whole file)
+- MOCK_SKIP_CRASH_SCAN=1        (default: unset) # don't scan input for crash tokens
+- MOCK_SEED=...                 (default: 42)   # int or string; "none" = fresh per execution
 - MOCK_SLEEP_MS=...             (default: 0)    # simulate engine runtime
+- MOCK_PRECISE_SLEEP=1          (default: unset) # busy-wait sleeps under 2 ms
+- MOCK_EDGES_BATCH=N            (default: 1)    # persistent-mode edges file batching
 
-CLI flags override env:
-  --mode {rand,inc}
-  --min N
-  --max N
-  --crash-rate R
-  --seed S
-  --sleep-ms MS
-  --edges-file PATH             (default: /tmp/kre8_edges.txt if --write-file set)
-  --write-file                  (toggle; write edges to file)
-  --js PATH                     (if not provided as trailing arg)
+Run with --help for the full list of flags.
 """
 
-import os, sys, time, argparse, random, hashlib, pathlib
-
-def parse_args():
-    p = argparse.ArgumentParser(description="Mock instrumented JS engine")
-    p.add_argument("--mode", choices=["rand","inc"], default=os.getenv("MOCK_EDGES_MODE","rand"))
-    p.add_argument("--min", type=int, default=int(os.getenv("MOCK_EDGES_MIN","100")))
-    p.add_argument("--max", type=int, default=int(os.getenv("MOCK_EDGES_MAX","5000")))
-    p.add_argument("--crash-rate", type=float, default=float(os.getenv("MOCK_CRASH_RATE","0.0")))
-    p.add_argument("--seed", type=str, default=os.getenv("MOCK_SEED"))
-    p.add_argument("--sleep-ms", type=int, default=int(os.getenv("MOCK_SLEEP_MS","0")))
-    p.add_argument("--edges-file", type=str, default=None)
-    p.add_argument("--write-file", action="store_true")
-    p.add_argument("--js", type=str, default=None, help="JS file path (optional if provided as trailing arg)")
-    p.add_argument("positional_js", nargs="?", help="JS file path")
-    return p.parse_args()
+import os
+import random
+import stat
+import sys
+import time
+import types
 
-def main():
-    args = parse_args()
-    js_path = args.js or args.positional_js
-    if not js_path:
-        print("Usage error: missing JS file (use --js or provide as last arg).", file=sys.stderr)
-        sys.exit(2)
-
-    if not os.path.exists(js_path):
-        print(f"File not found: {js_path}", file=sys.stderr)
-        sys.exit(2)
-
-    # Seed RNG
-    if args.mode == "rand":
-        if args.seed:
-            random.seed(args.seed)
-        else:
-            try:
-                h = hashlib.sha1(pathlib.Path(js_path).read_bytes()).hexdigest()
-            except Exception:
-                h = str(time.time_ns())
-            random.seed(h + str(time.time_ns()))
-    # inc mode is deterministic on file props
-
-    # Sleep to simulate runtime
-    if args.sleep_ms > 0:
-        time.sleep(args.sleep_ms / 1000.0)
+DEFAULT_MODE = "rand"
+DEFAULT_MIN_EDGES = 100
+DEFAULT_MAX_EDGES = 10000
+DEFAULT_CRASH_RATE = 0.0
+DEFAULT_CRASH_SCAN_BYTES = 65536
+DEFAULT_SEED = 42
+DEFAULT_SLEEP_MS = 0
+DEFAULT_EDGES_FILE = "/tmp/kre8_edges.txt"
+DEFAULT_EDGES_BATCH = 1
+
+
+def _mode(value):
+    if value not in ("rand", "inc"):
+        raise ValueError(value)
+    return value
+
+
+def _seed(value):
+    """Seed as given: an int when it looks like one, any other string as-is,
+    and None (fresh seed per execution) for "" or "none"."""
+    if value in ("", "none"):
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _flag(value):
+    value = value.strip().lower()
+    if value in ("1", "true", "yes", "on"):
+        return True
+    if value in ("", "0", "false", "no", "off"):
+        return False
+    raise ValueError(value)
+
+
+# Bad MOCK_* values, reported as a usage error by parse_args
+_ENV_ERRORS = []
+
+
+def _env(name, conv, default):
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return conv(value)
+    except ValueError:
+        _ENV_ERRORS.append(f"invalid {name} value: {value!r}")
+        return default
+
+
+# Env overrides, read once at import (they can't change within a process)
+_ENV_MODE = _env("MOCK_EDGES_MODE", _mode, DEFAULT_MODE)
+_ENV_MIN_EDGES = _env("MOCK_EDGES_MIN", int, DEFAULT_MIN_EDGES)
+_ENV_MAX_EDGES = _env("MOCK_EDGES_MAX", int, DEFAULT_MAX_EDGES)
+_ENV_CRASH_RATE = _env("MOCK_CRASH_RATE", float, DEFAULT_CRASH_RATE)
+_ENV_CRASH_SCAN_BYTES = _env("MOCK_CRASH_SCAN_BYTES", int, DEFAULT_CRASH_SCAN_BYTES)
+_ENV_SKIP_CRASH_SCAN = _env("MOCK_SKIP_CRASH_SCAN", _flag, False)
+_ENV_SEED = _env("MOCK_SEED", _seed, DEFAULT_SEED)
+_ENV_SLEEP_MS = _env("MOCK_SLEEP_MS", int, DEFAULT_SLEEP_MS)
+_ENV_EDGES_BATCH = _env("MOCK_EDGES_BATCH", int, DEFAULT_EDGES_BATCH)
+_ENV_PRECISE_SLEEP = _env("MOCK_PRECISE_SLEEP", _flag, False)
+
+# Leading bytes mixed into the inc-mode edge count
+INC_PREFIX_BYTES = 64
+
+# Inputs containing any of these always "crash"
+CRASH_TOKENS = (b"CRASH", b"throw")
+
+# Edges file descriptor, kept open across executions in --persistent mode
+_EDGES_FD = None
+
+# Hyperscan (database, ScanTerminated) for the crash-token scan; set by
+# enable_crash_db() in --persistent mode, bytes.find is used otherwise
+_CRASH_DB = None
+
+# seeded_draws results keyed by (seed, mode, min_edges, max_edges); a plain
+# dict rather than functools.lru_cache, whose import slows every startup
+_DRAWS_CACHE = {}
+_DRAWS_CACHE_MAX = 64
+
+_MASK64 = (1 << 64) - 1
+
+
+def build_parser():
+    """Full argparse parser, only built for --help and malformed args."""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Mock instrumented JS engine for testing kre8ntemjs coverage workflow"
+    )
+    parser.add_argument(
+        "js_file",
+        nargs="?",
+        help="JavaScript file to 'execute' (positional or --js)"
+    )
+    parser.add_argument(
+        "--js",
+        dest="js_file_flag",
+        help="JavaScript file to 'execute' (flag form)"
+    )
+    parser.add_argument(
+        "--mode",
+        choices=["rand", "inc"],
+        default=_ENV_MODE,
+        help="Edge count mode: 'rand' (random) or 'inc' (deterministic increment based on file)"
+    )
+    parser.add_argument(
+        "--min",
+        type=int,
+        default=_ENV_MIN_EDGES,
+        help="Minimum edge count (rand mode)"
+    )
+    parser.add_argument(
+        "--max",
+        type=int,
+        default=_ENV_MAX_EDGES,
+        help="Maximum edge count (rand mode)"
+    )
+    parser.add_argument(
+        "--crash-rate",
+        type=float,
+        default=_ENV_CRASH_RATE,
+        help="Probability of simulating a crash (0.0-1.0)"
+    )
+    parser.add_argument(
+        "--crash-scan-bytes",
+        type=int,
+        default=_ENV_CRASH_SCAN_BYTES,
+        help="Only scan this many leading bytes for crash tokens (0 = whole file)"
+    )
+    parser.add_argument(
+        "--no-crash-scan",
+        action="store_true",
+        default=_ENV_SKIP_CRASH_SCAN,
+        help="Skip scanning the file for crash tokens (--crash-rate still applies)"
+    )
+    parser.add_argument(
+        "--seed",
+        type=_seed,
+        default=_ENV_SEED,
+        help="Random seed for reproducibility (int or string; 'none' = fresh seed per execution)"
+    )
+    parser.add_argument(
+        "--sleep-ms",
+        type=int,
+        default=_ENV_SLEEP_MS,
+        help="Sleep duration in milliseconds (simulate execution time)"
+    )
+    parser.add_argument(
+        "--write-file",
+        action="store_true",
+        help="Write edge count to file (use with --edges-file)"
+    )
+    parser.add_argument(
+        "--edges-file",
+        default=DEFAULT_EDGES_FILE,
+        help="Path to write edge count (default: /tmp/kre8_edges.txt)"
+    )
+    parser.add_argument(
+        "--persistent",
+        action="store_true",
+        help="Read JS file paths from stdin, one per line, printing edges:<N> "
+             "(or 'edges:<N> crash') for each"
+    )
+    parser.add_argument(
+        "--edges-batch",
+        type=int,
+        default=_ENV_EDGES_BATCH,
+        help="In --persistent mode, write the edges file once per N executions"
+    )
 
-    # Decide crash
-    crashed = False
+    return parser
+
+
+# Flags understood by the fast-path scanner: flag -> (dest, type)
+_VALUE_FLAGS = {
+    "--js": ("js_file_flag", str),
+    "--mode": ("mode", _mode),
+    "--min": ("min", int),
+    "--max": ("max", int),
+    "--crash-rate": ("crash_rate", float),
+    "--crash-scan-bytes": ("crash_scan_bytes", int),
+    "--seed": ("seed", _seed),
+    "--sleep-ms": ("sleep_ms", int),
+    "--edges-file": ("edges_file", str),
+    "--edges-batch": ("edges_batch", int),
+}
+_SWITCH_FLAGS = {
+    "--write-file": "write_file",
+    "--persistent": "persistent",
+    "--no-crash-scan": "no_crash_scan",
+}
+
+
+def parse_args(argv=None):
+    """Scan argv by hand; argparse's import and setup dominate a mock run.
+
+    Anything the scanner doesn't recognise (--help, abbreviations, bad
+    values) is handed to argparse so usage and errors are unchanged.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+
+    if _ENV_ERRORS:
+        build_parser().error("; ".join(_ENV_ERRORS))
+
+    args = types.SimpleNamespace(
+        js_file=None,
+        js_file_flag=None,
+        mode=_ENV_MODE,
+        min=_ENV_MIN_EDGES,
+        max=_ENV_MAX_EDGES,
+        crash_rate=_ENV_CRASH_RATE,
+        crash_scan_bytes=_ENV_CRASH_SCAN_BYTES,
+        no_crash_scan=_ENV_SKIP_CRASH_SCAN,
+        seed=_ENV_SEED,
+        sleep_ms=_ENV_SLEEP_MS,
+        write_file=False,
+        edges_file=DEFAULT_EDGES_FILE,
+        persistent=False,
+        edges_batch=_ENV_EDGES_BATCH,
+    )
+
+    i = 0
+    positional_only = False
     try:
-        content = pathlib.Path(js_path).read_text(errors="ignore")
+        while i < len(argv):
+            arg = argv[i]
+            i += 1
+            if positional_only or arg == "-" or not arg.startswith("-"):
+                if args.js_file is not None:
+                    raise ValueError(arg)
+                args.js_file = arg
+            elif arg == "--":
+                positional_only = True
+            elif arg in _SWITCH_FLAGS:
+                setattr(args, _SWITCH_FLAGS[arg], True)
+            else:
+                flag, eq, value = arg.partition("=")
+                dest, conv = _VALUE_FLAGS[flag]
+                if not eq:
+                    value = argv[i]
+                    i += 1
+                    if value.startswith("--"):
+                        raise ValueError(value)
+                setattr(args, dest, conv(value))
+    except (KeyError, IndexError, ValueError):
+        return build_parser().parse_args(argv)
+
+    return args
+
+
+def _splitmix64(x):
+    """SplitMix64 finalizer: a cheap, well-mixed 64-bit hash of an int."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return x ^ (x >> 31)
+
+
+def edge_range(min_edges, max_edges):
+    """Clamp --min/--max to a usable, non-negative [lo, hi] range."""
+    lo = max(0, min_edges)
+    return lo, max(lo, max_edges)
+
+
+def _draws(seed, mode, min_edges, max_edges):
+    rng = random.Random(seed)
+    edges = rng.randint(*edge_range(min_edges, max_edges)) if mode == "rand" else None
+    return edges, rng.random()
+
+
+def seeded_draws(seed, mode, min_edges, max_edges, content=b""):
+    """Edge count (rand mode) and crash roll drawn right after seeding.
+
+    Every execution reseeds with the same seed, so the draws are constant
+    for a given configuration; caching them saves reseeding the Mersenne
+    Twister on each execution in --persistent mode. A None seed draws from
+    a fresh seed mixed from the input's first bytes and the clock.
+    """
+    if seed is None:
+        seed = int.from_bytes(content[:8], "little") ^ time.time_ns()
+        return _draws(seed, mode, min_edges, max_edges)
+    key = (seed, mode, min_edges, max_edges)
+    draws = _DRAWS_CACHE.get(key)
+    if draws is None:
+        if len(_DRAWS_CACHE) >= _DRAWS_CACHE_MAX:
+            del _DRAWS_CACHE[next(iter(_DRAWS_CACHE))]
+        draws = _DRAWS_CACHE[key] = _draws(seed, mode, min_edges, max_edges)
+    return draws
+
+
+def inc_edges(content: bytes, file_size, min_edges, max_edges):
+    """Deterministic edge count based on file size and leading bytes.
+
+    Mixes a constant amount of input (the first INC_PREFIX_BYTES) through
+    SplitMix64 rather than hashing the whole file, so the cost doesn't grow
+    with the input. Only content-derived values are mixed in, with no
+    optional hash backend, so the same bytes give the same count in a
+    fresh file and on any machine.
+    """
+    try:
+        h = _splitmix64(file_size)
+        prefix = content[:INC_PREFIX_BYTES]
+        for i in range(0, len(prefix), 8):
+            h = _splitmix64(h ^ int.from_bytes(prefix[i:i + 8], "little"))
+        # Normalize to reasonable range
+        lo, hi = edge_range(min_edges, max_edges)
+        base = lo + (h % (hi - lo)) if hi > lo else lo
+        size_bonus = min(file_size * 10, hi // 2)
+        return base + size_bonus
     except Exception:
-        content = ""
-    if "CRASH" in content:
-        crashed = True
+        return min_edges
+
+
+def compute_edge_count(content: bytes, mode, min_edges, max_edges, seed, st=None):
+    """Compute edge count based on mode.
+
+    In inc mode, st (the file's stat result) supplies the file size, which
+    may exceed len(content) when only a prefix was read; without it the
+    content length is used.
+    """
+    if mode == "rand":
+        return seeded_draws(seed, mode, min_edges, max_edges, content)[0]
+    elif mode == "inc":
+        if st is None:
+            return inc_edges(content, len(content), min_edges, max_edges)
+        return inc_edges(content, st.st_size, min_edges, max_edges)
     else:
-        if random.random() < args.crash_rate:
-            crashed = True
-
-    # Compute edges
-    if args.mode == "rand":
-        lo = max(0, args.min)
-        hi = max(args.min, args.max)
-        edges = random.randint(lo, hi)
+        return min_edges
+
+
+def enable_crash_db():
+    """Compile CRASH_TOKENS into a Hyperscan database for should_crash.
+
+    Only worth it in --persistent mode, where the compile is amortised.
+    Leaves the bytes.find scan in place if hyperscan isn't installed, fails
+    to load or compile, or disagrees with bytes.find on a few probes.
+    """
+    global _CRASH_DB
+    try:
+        import hyperscan
+
+        db = hyperscan.Database()
+        db.compile(
+            expressions=list(CRASH_TOKENS),
+            ids=list(range(len(CRASH_TOKENS))),
+            elements=len(CRASH_TOKENS),
+            flags=[0] * len(CRASH_TOKENS),
+        )
+        _CRASH_DB = (db, hyperscan.ScanTerminated)
+        ok = all(
+            has_crash_token(data, end) == _find_crash_token(data, end)
+            for data, end in _CRASH_DB_PROBES
+        )
+    except Exception:
+        ok = False
+    if not ok:
+        _CRASH_DB = None
+
+
+# (content, scan end) pairs used to check Hyperscan against bytes.find
+_CRASH_DB_PROBES = (
+    (b"", 0),
+    (b"let x = 1;", 10),
+    (b"CRASH", 5),
+    (b"a; throw e;", 11),
+    (b"thro w CRAS H", 13),
+    (b"abcdCRASH", 6),
+    (b"abc throw CRASH", 9),
+)
+
+
+def _on_crash_token(token_id, start, end, flags, context):
+    # context is [scan end, found]. Matches arrive in end-offset order, so
+    # the first one decides: inside the window or not, stop scanning.
+    context[1] = end <= context[0]
+    return True
+
+
+def _find_crash_token(content: bytes, end):
+    for token in CRASH_TOKENS:
+        if content.find(token, 0, end) != -1:
+            return True
+    return False
+
+
+def has_crash_token(content: bytes, end):
+    """Whether any of CRASH_TOKENS occurs in content[:end]."""
+    if _CRASH_DB is None:
+        return _find_crash_token(content, end)
+    db, terminated = _CRASH_DB
+    ctx = [end, False]
+    try:
+        db.scan(content, match_event_handler=_on_crash_token, context=ctx)
+    except terminated:
+        pass
+    return ctx[1]
+
+
+def should_crash(content: bytes, crash_rate, roll, scan_bytes=DEFAULT_CRASH_SCAN_BYTES, scan=True):
+    """Determine if this execution should crash."""
+    # Check for crash tokens in a bounded prefix of the file
+    # (tokens are ASCII, no decode needed)
+    if scan:
+        end = scan_bytes if scan_bytes > 0 else len(content)
+        if has_crash_token(content, end):
+            return True
+
+    # Random crash based on probability
+    return roll < crash_rate
+
+
+def simulate_runtime_ns(ns):
+    """Sleep for ns nanoseconds.
+
+    With MOCK_PRECISE_SLEEP=1, waits under 2 ms are busy-waited on the
+    monotonic clock, since time.sleep overshoots them noticeably. It's
+    opt-in so CI doesn't burn cores.
+    """
+    if _ENV_PRECISE_SLEEP and ns < 2_000_000:
+        deadline = time.monotonic_ns() + ns
+        while time.monotonic_ns() < deadline:
+            pass
     else:
-        st = os.stat(js_path)
-        edges = max(args.min, int(st.st_size + (st.st_mtime_ns % 10_000)) % max(args.min, args.max))
+        time.sleep(ns / 1e9)
+
+
+def write_edges_file(path, line: bytes, keep_open=False):
+    """Write the edges line with raw syscalls, skipping Python's buffered IO.
 
-    line = f"edges:{edges}"
-    print(line)
+    With keep_open (persistent mode) the fd is opened once and the line is
+    rewritten in place on every execution.
+    """
+    global _EDGES_FD
+    if keep_open:
+        if _EDGES_FD is None:
+            _EDGES_FD = os.open(path, os.O_WRONLY | os.O_CREAT, 0o644)
+        os.pwrite(_EDGES_FD, line, 0)
+        os.ftruncate(_EDGES_FD, len(line))
+        return
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, line)
+    finally:
+        os.close(fd)
+
+
+def _slurp(path, limit=None):
+    """Read a file with raw os calls (no pathlib/file-object overhead).
+
+    Reads at most limit bytes (None = whole file). Returns
+    (content, stat_result); for regular files st_size is the full file
+    size. Pipes and other non-regular inputs report no size, so they are
+    read until EOF (or limit).
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        want = limit
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            want = st.st_size if limit is None else min(st.st_size, limit)
+        chunks = []
+        got = 0
+        while want is None or got < want:
+            chunk = os.read(fd, 65536 if want is None else want - got)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            got += len(chunk)
+        return b"".join(chunks), st
+    finally:
+        os.close(fd)
 
-    if args.write_file:
-        path = args.edges_file or "/tmp/kre8_edges.txt"
+
+def _warn(msg):
+    # Output goes straight to the fd; print()'s text layer is overkill here
+    os.write(2, (msg + "\n").encode(errors="backslashreplace"))
+
+
+def save_edges(args, edges):
+    """Write edges to the edges file if requested, warning on failure."""
+    if args.write_file or args.edges_file != DEFAULT_EDGES_FILE:
         try:
-            with open(path, "w") as f:
-                f.write(line + "\n")
+            write_edges_file(args.edges_file, f"edges:{edges}\n".encode(), args.persistent)
         except Exception as e:
-            print(f"warn: failed to write {path}: {e}", file=sys.stderr)
+            _warn(f"Warning: Failed to write edges file: {e}")
+
+
+def execute(js_file, args):
+    """Run one mock execution; returns (edges, crashed) or None if unreadable."""
+    # Read the file once, and only as much of it as the edge count (inc
+    # prefix) and the crash-token scan window actually look at
+    limit = INC_PREFIX_BYTES
+    if not args.no_crash_scan:
+        limit = max(limit, args.crash_scan_bytes) if args.crash_scan_bytes > 0 else None
+    try:
+        content, st = _slurp(js_file, limit)
+    except FileNotFoundError:
+        _warn(f"Error: File not found: {js_file}")
+        return None
+    except OSError as e:
+        _warn(f"Error: cannot read {js_file}: {e.strerror}")
+        return None
+
+    # Simulate execution time
+    if args.sleep_ms > 0:
+        simulate_runtime_ns(args.sleep_ms * 1_000_000)
+
+    # Compute edge count (RNG draws are per-seed, so every execution is reproducible)
+    if not stat.S_ISREG(st.st_mode):
+        st = None  # no meaningful st_size; fall back to the bytes read
+    edges = compute_edge_count(content, args.mode, args.min, args.max, args.seed, st)
+
+    # Check if we should crash
+    roll = seeded_draws(args.seed, args.mode, args.min, args.max, content)[1]
+    crashed = should_crash(
+        content, args.crash_rate, roll, args.crash_scan_bytes, not args.no_crash_scan
+    )
+    if crashed:
+        os.write(2, b"ReferenceError: mock_var is not defined\n  at <anonymous>:1:1\n")
+
+    return edges, crashed
+
+
+def run_persistent(args):
+    """Read JS paths from stdin, one per line, answering each with edges:<N>.
+
+    Avoids paying interpreter startup per execution. A simulated crash is
+    answered with "edges:<N> crash". Blank lines and unreadable files are
+    answered with edges:0 so the driver always gets one line per input.
+
+    Every edges-file write overwrites the previous one, so with
+    --edges-batch N only the last result of each N executions is written.
+    """
+    if not args.no_crash_scan:
+        enable_crash_db()
+
+    pending = None
+    count = 0
+    for line in sys.stdin:
+        js_file = line.rstrip("\r\n")
+        result = execute(js_file, args) if js_file else None
+        if result is None:
+            os.write(1, b"edges:0\n")
+            continue
+        edges, crashed = result
+        pending = edges
+        count += 1
+        if count % max(1, args.edges_batch) == 0:
+            save_edges(args, pending)
+            pending = None
+        os.write(1, b"edges:%d crash\n" % edges if crashed else b"edges:%d\n" % edges)
+
+    if pending is not None:
+        save_edges(args, pending)
+
+
+def main():
+    args = parse_args()
+
+    if args.persistent:
+        if args.js_file_flag or args.js_file:
+            build_parser().error("--persistent reads JS paths from stdin; don't also pass a JS file")
+        run_persistent(args)
+        sys.exit(0)
+
+    # Determine JS file path
+    js_file = args.js_file_flag or args.js_file
+    if not js_file:
+        _warn("Error: No JavaScript file provided")
+        sys.exit(1)
+
+    result = execute(js_file, args)
+    if result is None:
+        sys.exit(1)
+    edges, crashed = result
+    save_edges(args, edges)
+
+    # Print to stdout
+    os.write(1, b"edges:%d\n" % edges)
 
     sys.exit(1 if crashed else 0)
 
+
 if __name__ == "__main__":
     main()